@@ -1,4 +1,4 @@
-from .crew import ResumeEnhancer
+from .crew import ResumeEnhancer, get_crew
 from .main import enhance_resume, run
 from .pdf_generation.resume_pdf import create_resume_pdf
 
@@ -8,6 +8,7 @@ __email__ = "you@example.com"
 
 __all__ = [
     "ResumeEnhancer",
+    "get_crew",
     "run",
     "enhance_resume",
     "create_resume_pdf",
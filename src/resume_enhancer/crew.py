@@ -1,4 +1,6 @@
-from typing import List
+import os
+import threading
+from typing import List, Optional, Tuple
 
 from crewai import Agent, Crew, Process, Task
 from crewai.agents.agent_builder.base_agent import BaseAgent
@@ -7,6 +9,14 @@ from pydantic import BaseModel, Field
 
 MAX_RETRY_LIMIT = 3
 
+# Get the directory where this crew.py file is located
+current_dir = os.path.dirname(os.path.abspath(__file__))
+
+CONFIG_FILES = (
+    os.path.join(current_dir, "config", "agents.yaml"),
+    os.path.join(current_dir, "config", "tasks.yaml"),
+)
+
 
 class Feedback(BaseModel):
     is_positive: bool = Field(description="Is the feedback positive?")
@@ -122,3 +132,35 @@ class ResumeEnhancer:
             process=Process.sequential,
             verbose=True,
         )
+
+
+_crew_lock = threading.Lock()
+_crew_template: Optional[Crew] = None
+_crew_signature: Optional[Tuple] = None
+
+
+def _config_signature() -> Tuple:
+    stats = [os.stat(path) for path in CONFIG_FILES]
+    return tuple((stat.st_mtime_ns, stat.st_size) for stat in stats)
+
+
+def get_crew() -> Crew:
+    """
+    Return a fresh crew ready for a single kickoff.
+
+    The YAML configs are parsed and the agents, tasks and LLM clients are
+    built only once per process; each call returns a copy of that template
+    so concurrent kickoffs never share interpolated state. The template is
+    rebuilt when agents.yaml or tasks.yaml change on disk.
+    """
+    global _crew_template, _crew_signature
+
+    signature = _config_signature()
+
+    with _crew_lock:
+        if _crew_template is None or _crew_signature != signature:
+            _crew_template = ResumeEnhancer().crew()
+            _crew_signature = signature
+        template = _crew_template
+
+    return template.copy()
@@ -1,8 +1,9 @@
 #!/usr/bin/env python
 import warnings
+import time
 from datetime import datetime
 
-from resume_enhancer.crew import ResumeEnhancer
+from resume_enhancer.crew import ResumeEnhancer, get_crew
 from resume_enhancer.util import extract_me_resume, extract_resume
 
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
@@ -22,7 +23,7 @@ def enhance_resume(resume):
     inputs = {"resume": resume_info, "today": str(datetime.now())}
 
     try:
-        result = ResumeEnhancer().crew().kickoff(inputs=inputs)
+        result = get_crew().kickoff(inputs=inputs)
         return result.raw
     except Exception as e:
         raise Exception(f"An error occurred while running the crew: {e}")
@@ -35,7 +36,27 @@ def run():
     inputs = {"resume": resume, "today": str(datetime.now())}
 
     try:
-        result = ResumeEnhancer().crew().kickoff(inputs=inputs)
+        result = get_crew().kickoff(inputs=inputs)
         return result.raw
     except Exception as e:
         raise Exception(f"An error occurred while running the crew: {e}")
+
+
+def benchmark(iterations=20):
+    """
+    Compare per-request crew setup time with and without the cached template.
+    """
+    start = time.perf_counter()
+    for _ in range(iterations):
+        ResumeEnhancer().crew()
+    uncached = (time.perf_counter() - start) / iterations
+
+    get_crew()  # Warm up the template
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        get_crew()
+    cached = (time.perf_counter() - start) / iterations
+
+    print(f"Fresh crew per request:  {uncached * 1000:.2f} ms")
+    print(f"Cached crew per request: {cached * 1000:.2f} ms")